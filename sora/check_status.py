@@ -1,12 +1,8 @@
 """Check the status of a Sora video generation job."""
 
 import sys
-import os
-from openai import OpenAI
-from dotenv import load_dotenv
 
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from sora_client import get_client
 
 if len(sys.argv) < 2:
     print("Usage: uv run check_status.py <video_id>")
@@ -14,6 +10,7 @@ if len(sys.argv) < 2:
 
 video_id = sys.argv[1]
 
+client = get_client()
 job = client.videos.retrieve(video_id)
 print(f"Video ID: {video_id}")
 print(f"Status:   {job.status}")
@@ -2,11 +2,9 @@
 
 import sys
 import os
-from openai import OpenAI
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
 
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from sora_client import get_client
 
 if len(sys.argv) < 2:
     print("Usage: uv run download_video.py <video_id>")
@@ -16,14 +14,27 @@ video_id = sys.argv[1]
 output_dir = "output"
 os.makedirs(output_dir, exist_ok=True)
 
-for variant in ["video", "thumbnail", "spritesheet"]:
+client = get_client()
+
+
+def fetch(variant):
     try:
         print(f"Downloading {variant}...")
-        resp = client.videos.download_content(video_id=video_id, variant=variant)
         ext = "mp4" if variant == "video" else "png"  # thumbnail and spritesheet are both png
         filepath = f"{output_dir}/{video_id}_{variant}.{ext}"
-        with open(filepath, "wb") as f:
-            f.write(resp.read())
+        # Plain download_content buffers the whole body before returning, so
+        # go through with_streaming_response to stream to disk as chunks arrive
+        with client.videos.with_streaming_response.download_content(
+            video_id=video_id, variant=variant,
+        ) as resp, open(filepath, "wb") as f:
+            for chunk in resp.iter_bytes(chunk_size=1 << 20):
+                f.write(chunk)
         print(f"  Saved: {filepath}")
     except Exception as e:
         print(f"  Failed: {e}")
+
+
+# The three variants are independent downloads, so fetch them concurrently
+variants = ["video", "thumbnail", "spritesheet"]
+with ThreadPoolExecutor(max_workers=len(variants)) as pool:
+    list(pool.map(fetch, variants))
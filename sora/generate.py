@@ -9,99 +9,31 @@ Usage:
     uv run generate.py --prompt "custom prompt text here"
     uv run generate.py --prompt flying --model sora-2-pro --seconds 4
     uv run generate.py --prompt flying --size 1920x1080
+    uv run generate.py --prompt flying idle walking   # run several in parallel
 
 Requires OPENAI_API_KEY in a .env file or as an environment variable.
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import time
+import random
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from openai import OpenAI
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING
 from PIL import Image
 import io
 
-# ---------------------------------------------------------------------------
-# PROMPT PRESETS — add or edit these to quickly switch between animations
-# ---------------------------------------------------------------------------
-PROMPT_PRESETS: dict[str, str] = {
-    "flying": (
-        "Animate this pixel art bird character flying with a smooth wing-flapping "
-        "cycle. The bird flaps its wings up and down in a looping flight animation. "
-        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
-        "No rotation, no zoom, no camera movement, no perspective shift. "
-        "The character stays the exact same size, scale, and position throughout "
-        "every frame. No shadows, no gradients, no environmental elements. "
-        "Pixel art style preserved exactly."
-    ),
-    "idle": (
-        "Animate this pixel art bird character with a breathing idle animation. "
-        "The bird's chest visibly expands and contracts in a steady breathing rhythm. "
-        "Its body gently bobs up and down in a smooth looping cycle. "
-        "Small feather adjustments as it settles. "
-        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
-        "No rotation, no zoom, no camera movement. The character stays the exact same "
-        "size and scale throughout. No shadows, no gradients, no environmental elements. "
-        "Pixel art style preserved exactly."
-    ),
-    "walking": (
-        "Animate this pixel art bird character walking to the right with a cute "
-        "bouncing walk cycle. The feet alternate in a stepping motion. "
-        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
-        "No rotation, no zoom, no camera movement. The character stays the exact same "
-        "size and scale throughout. No shadows, no gradients, no environmental elements. "
-        "Pixel art style preserved exactly."
-    ),
-    "pecking": (
-        "Animate this pixel art bird character pecking at the ground repeatedly. "
-        "The bird leans forward and taps its beak down, then returns upright, in a loop. "
-        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
-        "No rotation, no zoom, no camera movement. The character stays the exact same "
-        "size and scale throughout. No shadows, no gradients, no environmental elements. "
-        "Pixel art style preserved exactly."
-    ),
-    "eating": (
-        "Animate this pixel art bird character eating. The bird opens and closes its beak "
-        "in a chewing motion while small crumb particles fall from its beak. The bird looks "
-        "content while munching. No actual food item shown, just the eating action with crumbs. "
-        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
-        "No rotation, no zoom, no camera movement. The character stays the exact same "
-        "size and scale throughout. No shadows, no gradients, no environmental elements. "
-        "Pixel art style preserved exactly."
-    ),
-    "surprised": (
-        "Animate this pixel art bird character reacting to being touched. The bird first "
-        "jumps slightly with wide surprised eyes and ruffled feathers, then transitions into "
-        "a happy expression with eyes closing contentedly and a slight wiggle of joy. "
-        "The reaction goes from startled to pleased. "
-        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
-        "No rotation, no zoom, no camera movement. The character stays the exact same "
-        "size and scale throughout. No shadows, no gradients, no environmental elements. "
-        "Pixel art style preserved exactly."
-    ),
-    "hungry": (
-        "Animate this pixel art bird character looking hungry. The bird's belly visibly "
-        "rumbles and shakes. The bird looks down at its stomach with a sad, longing expression. "
-        "Small motion lines appear around the belly to show rumbling. The bird occasionally "
-        "glances around hopefully looking for food. "
-        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
-        "No rotation, no zoom, no camera movement. The character stays the exact same "
-        "size and scale throughout. No shadows, no gradients, no environmental elements. "
-        "Pixel art style preserved exactly."
-    ),
-    "hatching": (
-        "Animate a pixel art egg slowly cracking and hatching into this bird character. "
-        "The egg starts whole, then small cracks appear and spread across the shell. "
-        "The egg wobbles and shakes as the bird inside pushes. Pieces of shell break off "
-        "gradually until the bird emerges, looking around with fresh curious eyes. "
-        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
-        "No rotation, no zoom, no camera movement. The egg and bird stay the exact same "
-        "size and scale throughout. No shadows, no gradients, no environmental elements. "
-        "Pixel art style preserved exactly."
-    ),
-}
+from sora_client import get_client
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# Prompt presets live in prompts.py and are imported lazily so the text blob
+# stays off this module's import path.
 
 # ---------------------------------------------------------------------------
 # Video size options (width x height)
@@ -118,18 +50,10 @@ DEFAULT_IMAGE = "original.png"
 OUTPUT_DIR = "output"
 
 
-def get_client() -> OpenAI:
-    load_dotenv()
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        print("Error: OPENAI_API_KEY not found.")
-        print("Set it in a .env file (OPENAI_API_KEY=sk-...) or export it.")
-        sys.exit(1)
-    return OpenAI(api_key=api_key)
-
-
 def resolve_prompt(prompt_input: str) -> str:
     """Resolve a prompt from a preset name, a .txt file path, or raw text."""
+    from prompts import PROMPT_PRESETS
+
     # Check presets first
     if prompt_input in PROMPT_PRESETS:
         print(f"Using preset prompt: '{prompt_input}'")
@@ -145,8 +69,18 @@ def resolve_prompt(prompt_input: str) -> str:
     return prompt_input
 
 
+# Resized-image cache so a batched run reusing the same reference image only
+# pays for the resize + PNG encode once. Keyed on mtime so edits invalidate it.
+_resize_cache: dict[tuple[str, float, str], bytes] = {}
+
+
 def resize_image_to_match(image_path: str, target_size: str) -> bytes:
     """Resize the input image to match the target video resolution and return as bytes."""
+    cache_key = (image_path, os.path.getmtime(image_path), target_size)
+    cached = _resize_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     width, height = map(int, target_size.split("x"))
     img = Image.open(image_path)
 
@@ -161,15 +95,18 @@ def resize_image_to_match(image_path: str, target_size: str) -> bytes:
         img_resized = bg
 
     buf = io.BytesIO()
-    img_resized.save(buf, format="PNG")
-    buf.seek(0)
-    return buf
+    # compress_level=1: this PNG only travels to the API once, so favor a
+    # fast encode over squeezing out a few KB with the default level 6
+    img_resized.save(buf, format="PNG", compress_level=1)
+    data = buf.getvalue()
+    _resize_cache[cache_key] = data
+    return data
 
 
 def create_video(client: OpenAI, prompt: str, image_path: str,
                  model: str, size: str, seconds: int) -> str:
     """Submit a video generation job and return the video ID."""
-    image_buf = resize_image_to_match(image_path, size)
+    image_bytes = resize_image_to_match(image_path, size)
 
     print(f"\nSubmitting video generation job...")
     print(f"  Model:    {model}")
@@ -180,7 +117,7 @@ def create_video(client: OpenAI, prompt: str, image_path: str,
 
     video = client.videos.create(
         model=model,
-        input_reference=("image.png", image_buf, "image/png"),
+        input_reference=("image.png", image_bytes, "image/png"),
         prompt=prompt,
         size=size,
         seconds=seconds,
@@ -191,16 +128,23 @@ def create_video(client: OpenAI, prompt: str, image_path: str,
 
 
 def wait_for_completion(client: OpenAI, video_id: str,
-                        poll_interval: int = 10, timeout: int = 600):
-    """Poll until the video job completes or fails."""
-    print(f"\nWaiting for video to finish (polling every {poll_interval}s, timeout {timeout}s)...")
-    elapsed = 0
-    while elapsed < timeout:
+                        poll_interval: float = 2, max_interval: float = 30,
+                        timeout: int = 600):
+    """Poll until the video job completes or fails.
+
+    Polling starts at poll_interval and backs off exponentially up to
+    max_interval — fast feedback for quick jobs without hammering the API on
+    long ones. Each sleep is jittered so parallel jobs don't poll in lockstep.
+    """
+    print(f"\nWaiting for {video_id} to finish (timeout {timeout}s)...")
+    start = time.monotonic()
+    interval = poll_interval
+    while (elapsed := time.monotonic() - start) < timeout:
         job = client.videos.retrieve(video_id)
         status = job.status
         progress = getattr(job, "progress", None)
         progress_str = f"{progress}%" if progress is not None else "?"
-        print(f"  [{elapsed:>4}s] Status: {status}, Progress: {progress_str}")
+        print(f"  [{video_id} {elapsed:>4.0f}s] Status: {status}, Progress: {progress_str}")
 
         if status == "completed":
             print("  Video generation complete!")
@@ -211,14 +155,14 @@ def wait_for_completion(client: OpenAI, video_id: str,
                 error_msg = error_msg.message
             raise RuntimeError(f"Video generation failed: {error_msg}")
 
-        time.sleep(poll_interval)
-        elapsed += poll_interval
+        time.sleep(interval * random.uniform(0.8, 1.2))
+        interval = min(interval * 1.6, max_interval)
 
     raise RuntimeError(f"Timed out after {timeout}s waiting for video {video_id}")
 
 
 def download_outputs(client: OpenAI, video_id: str, prompt_name: str):
-    """Download the sprite sheet, thumbnail, and video."""
+    """Download the sprite sheet, thumbnail, and video (concurrently)."""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     base = f"{OUTPUT_DIR}/{prompt_name}_{video_id}"
 
@@ -228,32 +172,40 @@ def download_outputs(client: OpenAI, video_id: str, prompt_name: str):
         "video": f"{base}.mp4",
     }
 
-    for variant, filepath in variants.items():
+    def fetch(item):
+        variant, filepath = item
         try:
             print(f"  Downloading {variant}...")
-            response = client.videos.download_content(
+            # Plain download_content buffers the whole body before returning,
+            # so go through with_streaming_response to actually stream the
+            # file (the mp4 can be tens of MB) to disk as chunks arrive
+            size = 0
+            with client.videos.with_streaming_response.download_content(
                 video_id=video_id,
                 variant=variant,
-            )
-            data = response.read()
-            with open(filepath, "wb") as f:
-                f.write(data)
-            print(f"    Saved: {filepath} ({len(data) / 1024:.1f} KB)")
+            ) as response, open(filepath, "wb") as f:
+                for chunk in response.iter_bytes(chunk_size=1 << 20):
+                    f.write(chunk)
+                    size += len(chunk)
+            print(f"    Saved: {filepath} ({size / 1024:.1f} KB)")
         except Exception as e:
             print(f"    Skipped {variant}: {e}")
 
+    # The variants are independent network-bound fetches, so run them in
+    # parallel threads instead of back to back
+    with ThreadPoolExecutor(max_workers=len(variants)) as pool:
+        list(pool.map(fetch, variants.items()))
+
     return variants
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Generate animated sprite sheets from a reference image using Sora.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"Available prompt presets: {', '.join(PROMPT_PRESETS.keys())}",
     )
     parser.add_argument(
-        "--prompt", required=True,
-        help="A preset name (flying, idle, walking, pecking, eating, surprised, hungry, hatching), a .txt file path, or raw prompt text.",
+        "--prompt", required=True, nargs="+",
+        help="One or more of: a preset name (flying, idle, walking, pecking, eating, surprised, hungry, hatching), a .txt file path, or raw prompt text. Multiple prompts run as one pipelined batch.",
     )
     parser.add_argument(
         "--image", default=DEFAULT_IMAGE,
@@ -279,20 +231,44 @@ def main():
         print(f"Error: Image file not found: {args.image}")
         sys.exit(1)
 
-    prompt = resolve_prompt(args.prompt)
-
-    # Determine a short name for output files
-    prompt_name = args.prompt if args.prompt in PROMPT_PRESETS else "custom"
+    # Deferred until after argument validation, like the SDK import
+    from prompts import PROMPT_PRESETS
 
     client = get_client()
-    video_id = create_video(client, prompt, args.image, args.model, args.size, args.seconds)
-    wait_for_completion(client, video_id)
 
-    print(f"\nDownloading outputs...")
-    variants = download_outputs(client, video_id, prompt_name)
+    # Submit every job up front so Sora renders them all concurrently, then
+    # poll + download each in its own thread. The heavy lifting happens
+    # server-side, so even a big batch only costs us idle polling threads.
+    jobs = []
+    for prompt_input in args.prompt:
+        prompt = resolve_prompt(prompt_input)
+        # Determine a short name for output files
+        prompt_name = prompt_input if prompt_input in PROMPT_PRESETS else "custom"
+        video_id = create_video(client, prompt, args.image, args.model, args.size, args.seconds)
+        jobs.append((prompt_name, video_id))
+
+    def finish_job(job):
+        prompt_name, video_id = job
+        # One failed render must not take down the rest of the batch
+        try:
+            wait_for_completion(client, video_id)
+        except Exception as e:
+            print(f"\nJob {video_id} ({prompt_name}) failed: {e}")
+            return None
+        print(f"\nDownloading outputs for {video_id}...")
+        return download_outputs(client, video_id, prompt_name)
 
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        results = list(pool.map(finish_job, jobs))
+
+    failed = sum(1 for variants in results if variants is None)
     print(f"\nDone! Files saved to {OUTPUT_DIR}/")
-    print(f"  Sprite sheet: {variants.get('spritesheet', 'N/A')}")
+    for variants in results:
+        if variants is not None:
+            print(f"  Sprite sheet: {variants.get('spritesheet', 'N/A')}")
+    if failed:
+        print(f"  {failed} of {len(jobs)} job(s) failed.")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+"""
+Prompt presets for generate.py — add or edit these to quickly switch between
+animations. Kept in their own module so the several KB of prompt text is only
+loaded when a preset is actually looked up.
+"""
+
+PROMPT_PRESETS: dict[str, str] = {
+    "flying": (
+        "Animate this pixel art bird character flying with a smooth wing-flapping "
+        "cycle. The bird flaps its wings up and down in a looping flight animation. "
+        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
+        "No rotation, no zoom, no camera movement, no perspective shift. "
+        "The character stays the exact same size, scale, and position throughout "
+        "every frame. No shadows, no gradients, no environmental elements. "
+        "Pixel art style preserved exactly."
+    ),
+    "idle": (
+        "Animate this pixel art bird character with a breathing idle animation. "
+        "The bird's chest visibly expands and contracts in a steady breathing rhythm. "
+        "Its body gently bobs up and down in a smooth looping cycle. "
+        "Small feather adjustments as it settles. "
+        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
+        "No rotation, no zoom, no camera movement. The character stays the exact same "
+        "size and scale throughout. No shadows, no gradients, no environmental elements. "
+        "Pixel art style preserved exactly."
+    ),
+    "walking": (
+        "Animate this pixel art bird character walking to the right with a cute "
+        "bouncing walk cycle. The feet alternate in a stepping motion. "
+        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
+        "No rotation, no zoom, no camera movement. The character stays the exact same "
+        "size and scale throughout. No shadows, no gradients, no environmental elements. "
+        "Pixel art style preserved exactly."
+    ),
+    "pecking": (
+        "Animate this pixel art bird character pecking at the ground repeatedly. "
+        "The bird leans forward and taps its beak down, then returns upright, in a loop. "
+        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
+        "No rotation, no zoom, no camera movement. The character stays the exact same "
+        "size and scale throughout. No shadows, no gradients, no environmental elements. "
+        "Pixel art style preserved exactly."
+    ),
+    "eating": (
+        "Animate this pixel art bird character eating. The bird opens and closes its beak "
+        "in a chewing motion while small crumb particles fall from its beak. The bird looks "
+        "content while munching. No actual food item shown, just the eating action with crumbs. "
+        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
+        "No rotation, no zoom, no camera movement. The character stays the exact same "
+        "size and scale throughout. No shadows, no gradients, no environmental elements. "
+        "Pixel art style preserved exactly."
+    ),
+    "surprised": (
+        "Animate this pixel art bird character reacting to being touched. The bird first "
+        "jumps slightly with wide surprised eyes and ruffled feathers, then transitions into "
+        "a happy expression with eyes closing contentedly and a slight wiggle of joy. "
+        "The reaction goes from startled to pleased. "
+        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
+        "No rotation, no zoom, no camera movement. The character stays the exact same "
+        "size and scale throughout. No shadows, no gradients, no environmental elements. "
+        "Pixel art style preserved exactly."
+    ),
+    "hungry": (
+        "Animate this pixel art bird character looking hungry. The bird's belly visibly "
+        "rumbles and shakes. The bird looks down at its stomach with a sad, longing expression. "
+        "Small motion lines appear around the belly to show rumbling. The bird occasionally "
+        "glances around hopefully looking for food. "
+        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
+        "No rotation, no zoom, no camera movement. The character stays the exact same "
+        "size and scale throughout. No shadows, no gradients, no environmental elements. "
+        "Pixel art style preserved exactly."
+    ),
+    "hatching": (
+        "Animate a pixel art egg slowly cracking and hatching into this bird character. "
+        "The egg starts whole, then small cracks appear and spread across the shell. "
+        "The egg wobbles and shakes as the bird inside pushes. Pieces of shell break off "
+        "gradually until the bird emerges, looking around with fresh curious eyes. "
+        "Pure white #FFFFFF background. Flat 2D side view, perfectly orthographic. "
+        "No rotation, no zoom, no camera movement. The egg and bird stay the exact same "
+        "size and scale throughout. No shadows, no gradients, no environmental elements. "
+        "Pixel art style preserved exactly."
+    ),
+}
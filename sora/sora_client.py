@@ -0,0 +1,47 @@
+"""
+Shared OpenAI client for the Sora scripts.
+
+All scripts get their client from get_client() so a run reuses one OpenAI
+client — and its underlying httpx connection pool — instead of building a
+fresh client (and re-handshaking TLS) per call site.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+_client: OpenAI | None = None
+
+
+def get_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use."""
+    global _client
+    if _client is None:
+        # Imported here so scripts can print usage or fail argument
+        # validation without paying for the SDK import
+        import httpx
+        from dotenv import load_dotenv
+        from openai import OpenAI
+
+        load_dotenv()
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            print("Error: OPENAI_API_KEY not found.")
+            print("Set it in a .env file (OPENAI_API_KEY=sk-...) or export it.")
+            sys.exit(1)
+        # Enough keep-alive connections to cover a batch's poll loops plus
+        # the three parallel variant downloads; generous read timeout since
+        # the mp4 download can be slow
+        _client = OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                timeout=httpx.Timeout(600.0, connect=10.0),
+            ),
+        )
+    return _client